@@ -3,14 +3,31 @@
 SpaceMouse Navigation Plugin for QGIS
 """
 
-from qgis.PyQt.QtCore import QTimer, QThread, pyqtSignal, QSettings
+from qgis.PyQt.QtCore import (QObject, QMutex, QMutexLocker, QTimer, QThread,
+                              QSocketNotifier, pyqtSignal, QSettings)
 from qgis.PyQt.QtWidgets import QAction, QMessageBox
 from qgis.PyQt.QtGui import QIcon
-from qgis.core import QgsPointXY
+from qgis.core import Qgis, QgsMessageLog, QgsRectangle
+import math
 import os
+import struct
+import sys
+import time
 
 from .settings_dialog import SpaceMouseSettingsDialog
 
+# Print device discovery and read-loop diagnostics to the Python Console
+DEBUG = False
+
+# Blocking read timeout. It bounds how long stop() waits for the reader
+# thread and how long another user of the device lock waits behind a read.
+READ_TIMEOUT_MS = 20
+
+# Consecutive read errors tolerated before the read loop gives up, and the
+# pause between retries so a short glitch can actually recover
+MAX_READ_ERRORS = 5
+READ_RETRY_SECONDS = 0.1
+
 # Try to import HID library
 SPACEMOUSE_AVAILABLE = False
 HID_ERROR = None
@@ -27,161 +44,364 @@ except ImportError as e:
     except ImportError as e2:
         HID_ERROR = f"hid: {e}\nhidapi: {e2}"
 
+# Three little-endian signed 16-bit axes following the report ID byte
+_XYZ = struct.Struct('<hhh')
+
+# Approximate full-scale deflection of a translation axis in raw counts
+AXIS_RANGE = 350.0
+
+# Pan/zoom sensitivity is a fraction of the view per step at this many steps
+# per second, which matches the old fixed 10 ms read loop
+STEPS_PER_SECOND = 100.0
+
+# Longest time span applied in one canvas update, so a stalled event loop
+# doesn't turn into a large jump
+MAX_TICK_SECONDS = 0.1
+
+# 3Dconnexion vendor IDs
+_VENDOR_IDS = frozenset({
+    0x256f,  # 3Dconnexion (newer devices)
+    0x046d,  # Logitech/3Dconnexion (older devices)
+})
+
+# Known SpaceMouse product IDs (matched regardless of vendor ID)
+_PRODUCT_IDS = frozenset({
+    # 3Dconnexion (0x256f) devices
+    0xc62e, 0xc62f, 0xc631, 0xc632, 0xc633, 0xc635, 0xc636, 0xc640,
+    # Logitech/3Dconnexion (0x046d) devices
+    0xc603, 0xc605, 0xc606, 0xc621, 0xc623, 0xc625, 0xc626, 0xc627,
+    0xc628, 0xc629, 0xc62b,
+})
+
+_NO_DEVICE_MESSAGE = "No SpaceMouse device found. Make sure it's plugged in."
+
+# QSettings group holding the plugin settings
+SETTINGS_GROUP = 'spacemouse'
+
+# Setting key -> (default value, type)
+_DEFAULTS = {
+    'invert_x': (False, bool),
+    'invert_y': (False, bool),
+    'invert_z': (False, bool),
+    'swap_yz': (True, bool),
+    'pan_sensitivity': (0.005, float),
+    'zoom_sensitivity': (0.01, float),
+    'deadzone': (0.05, float),
+}
+
+
+def _parse_spacemouse_data(data):
+    """Parse raw HID data from SpaceMouse
+
+    SpaceMouse Compact format:
+    Report ID 1: Translation (X, Y, Z)
+    Report ID 2: Rotation (Roll, Pitch, Yaw) - we ignore this for 2D navigation
+    Report ID 3: Buttons (if present)
+    """
+    # Report ID in data[0] tells us what type of data this is.
+    # We only care about Report ID 1 (translation)
+    if len(data) < 7 or data[0] != 1:
+        return 0, 0, 0
+
+    # Translation data for Report ID 1:
+    # Bytes 1-2: X axis (left/right)
+    # Bytes 3-4: Y axis (forward/back)
+    # Bytes 5-6: Z axis (up/down)
+    # Raw counts are returned as-is; scaling by AXIS_RANGE is folded
+    # into the plugin's transform factors
+    return _XYZ.unpack_from(bytes(data[:7]), 1)
+
+
+def _has_spacemouse_name(device_info):
+    """Check if the product or manufacturer string looks like a 3Dconnexion device"""
+    product = device_info.get('product_string', '').lower()
+    manufacturer = device_info.get('manufacturer_string', '').lower()
+    return '3dconnex' in manufacturer or 'space' in product
+
+
+def _found(device_info):
+    """Return device_info, printing its details in debug mode"""
+    if DEBUG:
+        print(f"Found SpaceMouse: {device_info.get('product_string', 'Unknown')}")
+        print(f"  Manufacturer: {device_info.get('manufacturer_string', 'Unknown')}")
+        print(f"  VID: 0x{device_info['vendor_id']:04x}, PID: 0x{device_info['product_id']:04x}")
+    return device_info
+
+
+def find_spacemouse(device_hint=None):
+    """Return the hid.enumerate() entry of the first SpaceMouse, or None
+
+    :param device_hint: (vendor_id, product_id) to look for before
+        scanning for any known SpaceMouse
+    """
+    if device_hint:
+        devices = hid.enumerate(*device_hint)
+        if devices:
+            return _found(devices[0])
+
+    # Ask hidapi only for devices from known vendors first; this skips
+    # the name checks for every unrelated HID interface on the system
+    for vendor_id in _VENDOR_IDS:
+        for device_info in hid.enumerate(vendor_id, 0):
+            if device_info['product_id'] in _PRODUCT_IDS or _has_spacemouse_name(device_info):
+                return _found(device_info)
+
+    # Fall back to a full scan for devices only recognisable by name
+    for device_info in hid.enumerate():
+        if _has_spacemouse_name(device_info):
+            return _found(device_info)
+
+    return None
+
 
 class SpaceMouseThread(QThread):
     """Background thread to read SpaceMouse data"""
-    movement_signal = pyqtSignal(float, float, float)
+    movement_signal = pyqtSignal(int, int, int)
     error_signal = pyqtSignal(str)
+    # Emitted with (vendor_id, product_id) once the device has been opened
+    opened_signal = pyqtSignal(int, int)
     
-    # 3Dconnexion vendor IDs
-    VENDOR_IDS = [
-        0x256f,  # 3Dconnexion (newer devices)
-        0x046d,  # Logitech/3Dconnexion (older devices)
-    ]
-    
-    # Known SpaceMouse product IDs
-    PRODUCT_IDS = [
-        # 3Dconnexion (0x256f) devices
-        0xc62e, 0xc62f, 0xc631, 0xc632, 0xc633, 0xc635, 0xc636, 0xc640,
-        # Logitech/3Dconnexion (0x046d) devices  
-        0xc603, 0xc605, 0xc606, 0xc621, 0xc623, 0xc625, 0xc626, 0xc627,
-        0xc628, 0xc629, 0xc62b, 0xc62e, 0xc62f, 0xc631, 0xc632, 0xc633,
-    ]
-    
-    def __init__(self):
+    def __init__(self, device_hint=None):
+        """Constructor.
+        
+        :param device_hint: (vendor_id, product_id) of the last SpaceMouse
+            used, tried before enumerating HID devices
+        """
         super().__init__()
         self.running = False
         self.device = None
+        self.device_hint = device_hint
+        # Serialises all calls on the hid device handle; concurrent read and
+        # write/close on the same handle can deadlock on Linux hidraw.
+        # Reads hold it for up to READ_TIMEOUT_MS, so a writer (e.g. for
+        # LED or feature reports) waits at most that long.
+        self._dev_lock = QMutex()
         
     def run(self):
         """Main thread loop"""
         self.running = True
         
         try:
-            # Find SpaceMouse device by checking product names
-            all_devices = hid.enumerate()
-            
-            spacemouse_device = None
-            for device_info in all_devices:
-                product = device_info.get('product_string', '').lower()
-                manufacturer = device_info.get('manufacturer_string', '').lower()
-                vid = device_info['vendor_id']
-                pid = device_info['product_id']
-                
-                # Check if it's a 3Dconnexion device
-                is_3dconnexion = (
-                    '3dconnex' in manufacturer or
-                    'space' in product or
-                    (vid in self.VENDOR_IDS and pid in self.PRODUCT_IDS)
-                )
-                
-                if is_3dconnexion:
-                    spacemouse_device = device_info
-                    print(f"Found SpaceMouse: {device_info.get('product_string', 'Unknown')}")
-                    print(f"  Manufacturer: {device_info.get('manufacturer_string', 'Unknown')}")
-                    print(f"  VID: 0x{vid:04x}, PID: 0x{pid:04x}")
-                    break
-            
-            if not spacemouse_device:
-                self.error_signal.emit("No SpaceMouse device found. Make sure it's plugged in.")
+            ids = self._open_device()
+            if ids is None:
+                self.error_signal.emit(_NO_DEVICE_MESSAGE)
                 return
+            self.opened_signal.emit(*ids)
             
-            device_info = spacemouse_device
-            product_name = device_info.get('product_string', 'Unknown')
+            product_name = self.device.get_product_string() or 'Unknown'
             
-            print(f"Opening SpaceMouse: {product_name}")
-            print(f"  VID: 0x{device_info['vendor_id']:04x}")
-            print(f"  PID: 0x{device_info['product_id']:04x}")
+            # Blocking reads with a timeout: the OS wakes us as soon as a
+            # report arrives, and the timeout lets us notice stop() requests
+            self.device.set_nonblocking(0)
             
-            # Open the device using hid.device() syntax
-            self.device = hid.device()
-            self.device.open(device_info['vendor_id'], device_info['product_id'])
-            self.device.set_nonblocking(1)
-            
-            print("SpaceMouse opened successfully, starting read loop...")
+            if DEBUG:
+                print("SpaceMouse opened successfully, starting read loop...")
             
             # Read loop
             read_count = 0
+            error_count = 0
             while self.running:
                 try:
-                    data = self.device.read(64)
+                    data = self._read(READ_TIMEOUT_MS)
                     
-                    if data and len(data) > 0:
+                    # Drain anything else already queued so we act on the
+                    # current stick position rather than a stale one.
+                    # Translation reports carry absolute deflection, so only
+                    # the most recent one matters.
+                    translation = None
+                    while data:
                         read_count += 1
                         
+                        if read_count == 1:
+                            QgsMessageLog.logMessage(
+                                f"SpaceMouse streaming: {product_name}",
+                                "SpaceMouse",
+                                Qgis.Info
+                            )
+                        
                         # Debug: print first few packets
-                        if read_count <= 3:
+                        if DEBUG and read_count <= 3:
                             print(f"Packet {read_count}: {list(data[:8])}")
                         
-                        # Parse the data
-                        x, y, z = self._parse_spacemouse_data(data)
+                        if data[0] == 1:
+                            translation = data
                         
-                        # Only emit if there's actual movement
-                        if abs(x) > 0.001 or abs(y) > 0.001 or abs(z) > 0.001:
-                            self.movement_signal.emit(x, y, z)
+                        data = self._read(0)
                     
-                    # Small sleep to prevent CPU spinning
-                    import time
-                    time.sleep(0.01)
+                    if translation is not None:
+                        # Parse the data. Zero is emitted too, so the plugin
+                        # sees the stick return to rest
+                        x, y, z = _parse_spacemouse_data(translation)
+                        self.movement_signal.emit(x, y, z)
+                    
+                    error_count = 0
                     
                 except Exception as e:
-                    print(f"Read error: {e}")
-                    break
+                    error_count += 1
+                    if DEBUG:
+                        print(f"Read error: {e}")
+                    if error_count >= MAX_READ_ERRORS:
+                        self.error_signal.emit(f"SpaceMouse read error: {e}")
+                        break
+                    time.sleep(READ_RETRY_SECONDS)
             
-            print(f"SpaceMouse thread stopped. Total packets: {read_count}")
+            if DEBUG:
+                print(f"SpaceMouse thread stopped. Total packets: {read_count}")
                     
         except Exception as e:
             error_msg = f"SpaceMouse error: {e}"
-            print(error_msg)
+            if DEBUG:
+                print(error_msg)
             self.error_signal.emit(error_msg)
         finally:
+            self._close_device()
+    
+    def _open_device(self):
+        """Open the SpaceMouse into self.device
+        
+        The last known VID/PID is opened directly if given; HID devices are
+        only enumerated if that fails.
+        
+        :returns: (vendor_id, product_id) of the opened device, or None if
+            no SpaceMouse was found
+        """
+        if self.device_hint:
+            # Only a shortcut: any failure (the hidapi bindings raise
+            # different exception types) falls through to enumeration
+            try:
+                device = hid.device()
+                device.open(*self.device_hint)
+                self.device = device
+                return self.device_hint
+            except Exception as e:
+                if DEBUG:
+                    print(f"Could not open last SpaceMouse, enumerating: {e}")
+        
+        device_info = find_spacemouse()
+        if device_info is None:
+            return None
+        
+        vid = device_info['vendor_id']
+        pid = device_info['product_id']
+        if DEBUG:
+            print(f"Opening SpaceMouse: {device_info.get('product_string', 'Unknown')}")
+            print(f"  VID: 0x{vid:04x}")
+            print(f"  PID: 0x{pid:04x}")
+        
+        # Open the device using hid.device() syntax
+        self.device = hid.device()
+        self.device.open(vid, pid)
+        return vid, pid
+    
+    def _read(self, timeout_ms):
+        """Read one report from the device under the device lock"""
+        with QMutexLocker(self._dev_lock):
+            return self.device.read(64, timeout_ms=timeout_ms)
+    
+    def _close_device(self):
+        """Close the device under the device lock, if it is still open"""
+        with QMutexLocker(self._dev_lock):
             if self.device:
                 try:
                     self.device.close()
-                    print("SpaceMouse device closed")
+                    if DEBUG:
+                        print("SpaceMouse device closed")
                 except:
                     pass
-    
-    def _parse_spacemouse_data(self, data):
-        """Parse raw HID data from SpaceMouse
-        
-        SpaceMouse Compact format:
-        Report ID 1: Translation (X, Y, Z)
-        Report ID 2: Rotation (Roll, Pitch, Yaw) - we ignore this for 2D navigation
-        Report ID 3: Buttons (if present)
-        """
-        if len(data) < 7:
-            return 0.0, 0.0, 0.0
-        
-        # Report ID in data[0] tells us what type of data this is
-        report_id = data[0]
-        
-        # We only care about Report ID 1 (translation)
-        if report_id != 1:
-            return 0.0, 0.0, 0.0
-        
-        def bytes_to_int16(low, high):
-            """Convert two bytes to signed 16-bit integer"""
-            value = (high << 8) | low
-            if value >= 32768:
-                value -= 65536
-            return value / 350.0  # Scale to approximately -1.0 to 1.0
-        
-        # Translation data for Report ID 1:
-        # Bytes 1-2: X axis (left/right)
-        # Bytes 3-4: Y axis (forward/back)
-        # Bytes 5-6: Z axis (up/down)
-        x = bytes_to_int16(data[1], data[2])
-        y = bytes_to_int16(data[3], data[4])
-        z = bytes_to_int16(data[5], data[6])
-        
-        return x, y, z
+                self.device = None
     
     def stop(self):
         """Stop the thread"""
-        print("Stopping SpaceMouse thread...")
+        if DEBUG:
+            print("Stopping SpaceMouse thread...")
         self.running = False
         self.wait()
+        # run() normally closes the device on exit; only close here once the
+        # thread has finished so it never races with an in-flight read
+        self._close_device()
+
+
+class SpaceMouseNotifier(QObject):
+    """Read SpaceMouse data on the GUI thread through its hidraw node (Linux)
+    
+    A QSocketNotifier on the hidraw file descriptor wakes the Qt event loop
+    only when a report is readable, so no reader thread or cross-thread
+    signal is needed. Exposes the same signals as SpaceMouseThread.
+    """
+    movement_signal = pyqtSignal(int, int, int)
+    error_signal = pyqtSignal(str)
+    
+    def __init__(self, fd, product_name, parent=None):
+        super().__init__(parent)
+        self.fd = fd
+        self.product_name = product_name
+        self._streaming = False
+        # Reused for every read so draining reports doesn't allocate
+        self._buf = bytearray(64)
+        self.notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+        self.notifier.activated.connect(self._read_available)
+    
+    @classmethod
+    def open(cls, device_info, parent=None):
+        """Open the hidraw node behind device_info
+        
+        :returns: A reader, or None if the device has no usable hidraw node
+            (non-Linux platform, libusb backend or insufficient permissions)
+        """
+        if not sys.platform.startswith('linux'):
+            return None
+        
+        path = os.fsdecode(device_info.get('path', b''))
+        if not path.startswith('/dev/hidraw'):
+            return None
+        
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError as e:
+            if DEBUG:
+                print(f"Could not open {path}: {e}")
+            return None
+        
+        return cls(fd, device_info.get('product_string') or 'Unknown', parent)
+    
+    def _read_available(self):
+        """Drain all queued reports and emit the latest translation"""
+        buf = self._buf
+        translation = None
+        try:
+            while True:
+                size = os.readv(self.fd, (buf,))
+                if not size:
+                    break
+                if not self._streaming:
+                    self._streaming = True
+                    QgsMessageLog.logMessage(
+                        f"SpaceMouse streaming: {self.product_name}",
+                        "SpaceMouse",
+                        Qgis.Info
+                    )
+                # The buffer is overwritten by the next read, so decode
+                # translation reports (ID 1) straight away
+                if size >= 7 and buf[0] == 1:
+                    translation = _XYZ.unpack_from(buf, 1)
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            # Typically ENODEV after the device has been unplugged
+            self.stop()
+            self.error_signal.emit(f"SpaceMouse read error: {e}")
+            return
+        
+        if translation is not None:
+            self.movement_signal.emit(*translation)
+    
+    def stop(self):
+        """Stop watching the device and close it"""
+        if self.fd is None:
+            return
+        self.notifier.setEnabled(False)
+        os.close(self.fd)
+        self.fd = None
 
 
 class SpaceMousePlugin:
@@ -194,8 +414,21 @@ class SpaceMousePlugin:
         self.action = None
         self.settings_action = None
         self.thread = None
+        self.reader = None
         self.enabled = False
         
+        # Latest stick deflection (after deadzone) and time of the last
+        # canvas update
+        self._dx = self._dy = self._dz = 0
+        self._last_tick = 0.0
+        
+        # Apply the deflection at roughly screen refresh rate instead of
+        # redrawing the canvas for every HID report. Only runs while the
+        # stick is deflected.
+        self._timer = QTimer()
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._apply_movement)
+        
         # QSettings for persistent storage
         self.qsettings = QSettings()
         
@@ -204,25 +437,61 @@ class SpaceMousePlugin:
 
     def load_settings(self):
         """Load settings from QSettings"""
+        self.qsettings.beginGroup(SETTINGS_GROUP)
         self.settings = {
-            'invert_x': self.qsettings.value('spacemouse/invert_x', False, type=bool),
-            'invert_y': self.qsettings.value('spacemouse/invert_y', False, type=bool),
-            'invert_z': self.qsettings.value('spacemouse/invert_z', False, type=bool),
-            'swap_yz': self.qsettings.value('spacemouse/swap_yz', True, type=bool),
-            'pan_sensitivity': self.qsettings.value('spacemouse/pan_sensitivity', 0.005, type=float),
-            'zoom_sensitivity': self.qsettings.value('spacemouse/zoom_sensitivity', 0.01, type=float),
-            'deadzone': self.qsettings.value('spacemouse/deadzone', 0.05, type=float),
+            key: self.qsettings.value(key, default, type=value_type)
+            for key, (default, value_type) in _DEFAULTS.items()
         }
+        self.qsettings.endGroup()
+        self._recompute_transform()
+    
+    def _recompute_transform(self):
+        """Fold inversion, axis swapping and sensitivity into per-axis factors
+        
+        These only change when settings change, so handle_movement can apply
+        them with a few multiplications instead of re-evaluating each option.
+        """
+        # Movement arrives as raw counts, so normalise by AXIS_RANGE here
+        pan = self.settings['pan_sensitivity'] / AXIS_RANGE
+        zoom = self.settings['zoom_sensitivity'] / AXIS_RANGE
+        sign_x = -1.0 if self.settings['invert_x'] else 1.0
+        sign_y = -1.0 if self.settings['invert_y'] else 1.0
+        sign_z = -1.0 if self.settings['invert_z'] else 1.0
+        
+        self._deadzone = self.settings['deadzone'] * AXIS_RANGE
+        self._pan_x_scale = sign_x * pan
+        
+        # Vertical pan and zoom each take their input from either the Y or
+        # the Z axis depending on swap_yz; the unused source gets a zero factor.
+        # Vertical pan is negated for the correct screen direction.
+        if self.settings['swap_yz']:
+            self._pan_y_from_y, self._pan_y_from_z = 0.0, -sign_z * pan
+            self._zoom_from_y, self._zoom_from_z = sign_y * zoom, 0.0
+        else:
+            self._pan_y_from_y, self._pan_y_from_z = -sign_y * pan, 0.0
+            self._zoom_from_y, self._zoom_from_z = 0.0, sign_z * zoom
     
     def save_settings(self):
         """Save settings to QSettings"""
-        self.qsettings.setValue('spacemouse/invert_x', self.settings['invert_x'])
-        self.qsettings.setValue('spacemouse/invert_y', self.settings['invert_y'])
-        self.qsettings.setValue('spacemouse/invert_z', self.settings['invert_z'])
-        self.qsettings.setValue('spacemouse/swap_yz', self.settings['swap_yz'])
-        self.qsettings.setValue('spacemouse/pan_sensitivity', self.settings['pan_sensitivity'])
-        self.qsettings.setValue('spacemouse/zoom_sensitivity', self.settings['zoom_sensitivity'])
-        self.qsettings.setValue('spacemouse/deadzone', self.settings['deadzone'])
+        self.qsettings.beginGroup(SETTINGS_GROUP)
+        for key in _DEFAULTS:
+            self.qsettings.setValue(key, self.settings[key])
+        self.qsettings.endGroup()
+
+    def load_device_hint(self):
+        """Return the (vendor_id, product_id) of the last SpaceMouse used, or None"""
+        self.qsettings.beginGroup(SETTINGS_GROUP)
+        vid = self.qsettings.value('last_vid', 0, type=int)
+        pid = self.qsettings.value('last_pid', 0, type=int)
+        self.qsettings.endGroup()
+        return (vid, pid) if vid and pid else None
+    
+    def save_device_hint(self, vid, pid):
+        """Remember the SpaceMouse that was opened for the next start"""
+        self.qsettings.beginGroup(SETTINGS_GROUP)
+        self.qsettings.setValue('last_vid', vid)
+        self.qsettings.setValue('last_pid', pid)
+        self.qsettings.endGroup()
 
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
@@ -290,6 +559,7 @@ class SpaceMousePlugin:
         if dialog.exec_():
             self.settings = dialog.get_settings()
             self.save_settings()
+            self._recompute_transform()
             self.iface.messageBar().pushMessage(
                 "SpaceMouse",
                 "Settings saved",
@@ -301,35 +571,73 @@ class SpaceMousePlugin:
         """Start reading from SpaceMouse"""
         if not SPACEMOUSE_AVAILABLE:
             return
-            
-        if self.thread is None or not self.thread.isRunning():
-            self.thread = SpaceMouseThread()
+        
+        if self.reader is not None or (self.thread is not None and self.thread.isRunning()):
+            return
+        
+        device_hint = self.load_device_hint()
+        
+        # Prefer event-driven reads from the hidraw node on Linux, otherwise
+        # fall back to a blocking reader thread
+        if sys.platform.startswith('linux'):
+            device_info = find_spacemouse(device_hint)
+            if device_info is None:
+                self.handle_error(_NO_DEVICE_MESSAGE)
+                return
+            device_hint = (device_info['vendor_id'], device_info['product_id'])
+            self.reader = SpaceMouseNotifier.open(device_info, self.iface.mainWindow())
+        
+        if self.reader is not None:
+            self.reader.movement_signal.connect(self.handle_movement)
+            self.reader.error_signal.connect(self.handle_error)
+            self.save_device_hint(*device_hint)
+        else:
+            # On Linux this only happens when the hidraw node could not be
+            # opened; the hint then points the thread at the device found above
+            self.thread = SpaceMouseThread(device_hint)
             self.thread.movement_signal.connect(self.handle_movement)
             self.thread.error_signal.connect(self.handle_error)
-            self.thread.start()
-            self.enabled = True
-            self.iface.messageBar().pushMessage(
-                "SpaceMouse", 
-                "SpaceMouse navigation enabled - check Python Console for details", 
-                level=0,
-                duration=3
-            )
+            self.thread.opened_signal.connect(self.save_device_hint)
+            # Run above other QGIS workers so the reader wakes promptly
+            self.thread.start(QThread.HighPriority)
+        
+        self._dx = self._dy = self._dz = 0
+        self.enabled = True
+        self.iface.messageBar().pushMessage(
+            "SpaceMouse", 
+            "SpaceMouse navigation enabled", 
+            level=0,
+            duration=3
+        )
+
+    def _stop_reader(self):
+        """Close the hidraw reader, if one is active"""
+        if self.reader is not None:
+            self.reader.stop()
+            self.reader.deleteLater()
+            self.reader = None
 
     def stop_spacemouse(self):
         """Stop reading from SpaceMouse"""
-        if self.thread and self.thread.isRunning():
+        thread_running = self.thread is not None and self.thread.isRunning()
+        if self.reader is None and not thread_running:
+            return
+        
+        self._stop_reader()
+        if thread_running:
             self.thread.stop()
-            self.thread = None
-            self.enabled = False
-            self.iface.messageBar().pushMessage(
-                "SpaceMouse",
-                "SpaceMouse navigation disabled",
-                level=0,
-                duration=3
-            )
+        self.thread = None
+        self._timer.stop()
+        self.enabled = False
+        self.iface.messageBar().pushMessage(
+            "SpaceMouse",
+            "SpaceMouse navigation disabled",
+            level=0,
+            duration=3
+        )
     
     def handle_error(self, error_msg):
-        """Handle errors from the SpaceMouse thread"""
+        """Handle errors from the SpaceMouse reader"""
         self.iface.messageBar().pushMessage(
             "SpaceMouse Error",
             error_msg,
@@ -337,65 +645,83 @@ class SpaceMousePlugin:
             duration=5
         )
         self.action.setChecked(False)
+        self._stop_reader()
+        self._timer.stop()
         self.enabled = False
 
     def handle_movement(self, x, y, z):
         """Handle SpaceMouse movement data
         
-        :param x: Left/right movement (-1.0 to 1.0)
-        :param y: Forward/back movement (-1.0 to 1.0)
-        :param z: Up/down movement (-1.0 to 1.0)
+        Reports carry the absolute stick deflection, so only the latest one
+        is kept; _apply_movement turns it into pan/zoom per elapsed time.
+        
+        :param x: Left/right movement (raw counts, about -350 to 350)
+        :param y: Forward/back movement (raw counts, about -350 to 350)
+        :param z: Up/down movement (raw counts, about -350 to 350)
         """
         
-        # Apply inversions
-        if self.settings['invert_x']:
-            x = -x
-        if self.settings['invert_y']:
-            y = -y
-        if self.settings['invert_z']:
-            z = -z
-        
-        # Apply deadzone
-        deadzone = self.settings['deadzone']
-        if abs(x) < deadzone:
-            x = 0
-        if abs(y) < deadzone:
-            y = 0
-        if abs(z) < deadzone:
-            z = 0
-        
-        # Skip if no movement
+        # Apply deadzone (multiplying by the bool zeroes axes inside it)
+        deadzone = self._deadzone
+        x *= abs(x) >= deadzone
+        y *= abs(y) >= deadzone
+        z *= abs(z) >= deadzone
+        
+        self._dx, self._dy, self._dz = x, y, z
+        
+        if (x or y or z) and not self._timer.isActive():
+            self._last_tick = time.monotonic()
+            self._timer.start()
+    
+    def _apply_movement(self):
+        """Apply the current deflection for the time since the last tick"""
+        x, y, z = self._dx, self._dy, self._dz
+        
+        # Stop ticking once the stick is back at rest
         if x == 0 and y == 0 and z == 0:
+            self._timer.stop()
             return
         
-        # Swap Y and Z if configured
-        if self.settings['swap_yz']:
-            y, z = z, y
-        
-        # Get current map extent
-        extent = self.canvas.extent()
-        width = extent.width()
-        height = extent.height()
-        
-        # Calculate pan distances
-        pan_x = x * width * self.settings['pan_sensitivity']
-        pan_y = -y * height * self.settings['pan_sensitivity']  # Negative for correct direction
-        
-        # Get current center and calculate new center
-        center = self.canvas.center()
-        new_center = QgsPointXY(
-            center.x() + pan_x,
-            center.y() + pan_y
-        )
+        # Scale by elapsed time so the speed doesn't depend on the report
+        # rate or on timer jitter
+        now = time.monotonic()
+        steps = min(now - self._last_tick, MAX_TICK_SECONDS) * STEPS_PER_SECOND
+        self._last_tick = now
+        x *= steps
+        y *= steps
+        z *= steps
         
-        # Apply panning if there's pan movement
-        if pan_x != 0 or pan_y != 0:
-            self.canvas.setCenter(new_center)
+        # Read the requested extent once per tick. canvas.extent() is the
+        # bounding box of the visible area, which is larger than the
+        # requested extent when the map is rotated; feeding it back to
+        # setExtent would zoom out a little on every tick.
+        extent = self.canvas.mapSettings().extent()
+        x_min = extent.xMinimum()
+        x_max = extent.xMaximum()
+        y_min = extent.yMinimum()
+        y_max = extent.yMaximum()
+        width = x_max - x_min
+        height = y_max - y_min
+        
+        # Calculate pan distances (inversion, swap and sensitivity are
+        # already folded into the factors by _recompute_transform)
+        pan_x = x * width * self._pan_x_scale
+        pan_y = (y * self._pan_y_from_y + z * self._pan_y_from_z) * height
+        zoom = y * self._zoom_from_y + z * self._zoom_from_z
+        
+        # Don't schedule a redraw if the extent would not actually change
+        if pan_x == 0 and pan_y == 0 and zoom == 0:
+            return
         
-        # Apply zoom
-        if z != 0:
-            zoom_factor = 1.0 - (z * self.settings['zoom_sensitivity'])
-            self.canvas.zoomByFactor(zoom_factor)
+        # Build the target extent directly so the canvas only has to
+        # update (and redraw) once per tick. The zoom covers several steps
+        # of (1 - z); compounding them gives about exp(-steps * z), which
+        # also stays positive for large input.
+        zoom_factor = math.exp(-zoom)
+        half_w = width * zoom_factor / 2.0
+        half_h = height * zoom_factor / 2.0
+        cx = (x_min + x_max) / 2.0 + pan_x
+        cy = (y_min + y_max) / 2.0 + pan_y
+        self.canvas.setExtent(QgsRectangle(cx - half_w, cy - half_h, cx + half_w, cy + half_h))
         
         # Refresh the canvas
         self.canvas.refresh()